@@ -4,11 +4,14 @@
 import asyncio
 import logging
 import time
+import unittest
+import unittest.mock
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import httpx
 import python_graphql_client
+from typing_extensions import Self
 
 from .account import Account
 from .account_address import AccountAddress
@@ -17,6 +20,7 @@ from .bcs import Serializer
 from .metadata import Metadata
 from .transactions import (
     EntryFunction,
+    ModuleId,
     MultiAgentRawTransaction,
     RawTransaction,
     SignedTransaction,
@@ -26,6 +30,7 @@ from .transactions import (
 from .type_tag import StructTag, TypeTag
 
 U64_MAX = 18446744073709551615
+APTOS_ACCOUNT_MODULE = ModuleId(AccountAddress.from_str("0x1"), "aptos_account")
 
 
 @dataclass
@@ -67,8 +72,9 @@ class RestClient:
 
     def __init__(self, base_url: str, client_config: ClientConfig = ClientConfig()):
         self.base_url = base_url
-        # Default limits
-        limits = httpx.Limits()
+        # Default limits, but keep idle connections around long enough to be reused between
+        # submissions rather than paying for a new TCP + TLS handshake after 5 seconds.
+        limits = httpx.Limits(keepalive_expiry=30.0)
         # Default timeouts but do not set a pool timeout, since the idea is that jobs will wait as
         # long as progress is being made.
         timeout = httpx.Timeout(60.0, pool=None)
@@ -85,6 +91,12 @@ class RestClient:
         if client_config.api_key:
             self.client.headers["Authorization"] = f"Bearer {client_config.api_key}"
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def close(self):
         await self.client.aclose()
 
@@ -527,8 +539,7 @@ class RestClient:
         self, signed_transaction: SignedTransaction
     ) -> Dict[str, Any]:
         txn_hash = await self.submit_bcs_transaction(signed_transaction)
-        await self.wait_for_transaction(txn_hash)
-        return await self.transaction_by_hash(txn_hash)
+        return await self.wait_for_transaction(txn_hash)
 
     async def transaction_pending(self, txn_hash: str) -> bool:
         response = await self._get(endpoint=f"transactions/by_hash/{txn_hash}")
@@ -539,24 +550,50 @@ class RestClient:
             raise ApiError(response.text, response.status_code)
         return response.json()["type"] == "pending_transaction"
 
-    async def wait_for_transaction(self, txn_hash: str) -> None:
+    async def wait_for_transaction(self, txn_hash: str) -> Dict[str, Any]:
         """
         Waits up to the duration specified in client_config for a transaction to move past pending
-        state.
-        """
+        state and returns the committed transaction.
 
-        count = 0
-        while await self.transaction_pending(txn_hash):
-            assert (
-                count < self.client_config.transaction_wait_in_seconds
-            ), f"transaction {txn_hash} timed out"
-            await asyncio.sleep(1)
-            count += 1
+        This uses the node's wait_by_hash endpoint, which holds the request open until the
+        transaction is committed or the node's own wait timeout elapses, so a single round-trip
+        usually suffices. If the node does not serve wait_by_hash, it falls back to polling
+        by_hash. Between requests that find the transaction unknown or still pending, it backs off
+        exponentially, starting at 250 ms, up to 1 second.
+        """
 
-        response = await self._get(endpoint=f"transactions/by_hash/{txn_hash}")
+        deadline = time.monotonic() + self.client_config.transaction_wait_in_seconds
+        backoff = 0.25
+        long_poll = True
+        while True:
+            if long_poll:
+                endpoint = f"transactions/wait_by_hash/{txn_hash}"
+            else:
+                endpoint = f"transactions/by_hash/{txn_hash}"
+            response = await self._get(endpoint=endpoint)
+            if response.status_code == 404:
+                try:
+                    error_code = response.json().get("error_code")
+                except ValueError:
+                    error_code = None
+                if long_poll and error_code != "transaction_not_found":
+                    # The node (or a proxy in front of it) does not route wait_by_hash.
+                    long_poll = False
+                    continue
+            elif response.status_code >= 400:
+                raise ApiError(response.text, response.status_code)
+            elif response.json()["type"] != "pending_transaction":
+                break
+
+            assert time.monotonic() < deadline, f"transaction {txn_hash} timed out"
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 1.0)
+
+        transaction = response.json()
         assert (
-            "success" in response.json() and response.json()["success"]
+            "success" in transaction and transaction["success"]
         ), f"{response.text} - {txn_hash}"
+        return transaction
 
     async def account_transaction_sequence_number_status(
         self, address: AccountAddress, sequence_number: int
@@ -726,27 +763,33 @@ class RestClient:
     #
 
     # :!:>bcs_transfer
-    async def bcs_transfer(
-        self,
-        sender: Account,
-        recipient: AccountAddress,
-        amount: int,
-        sequence_number: Optional[int] = None,
-    ) -> str:
+    @staticmethod
+    def transfer_payload(recipient: AccountAddress, amount: int) -> TransactionPayload:
+        """Returns a payload calling 0x1::aptos_account::transfer of amount to recipient."""
         transaction_arguments = [
             TransactionArgument(recipient, Serializer.struct),
             TransactionArgument(amount, Serializer.u64),
         ]
 
-        payload = EntryFunction.natural(
-            "0x1::aptos_account",
+        payload = EntryFunction(
+            APTOS_ACCOUNT_MODULE,
             "transfer",
             [],
-            transaction_arguments,
+            [arg.encode() for arg in transaction_arguments],
         )
+        return TransactionPayload(payload)
 
+    async def bcs_transfer(
+        self,
+        sender: Account,
+        recipient: AccountAddress,
+        amount: int,
+        sequence_number: Optional[int] = None,
+    ) -> str:
         signed_transaction = await self.create_bcs_signed_transaction(
-            sender, TransactionPayload(payload), sequence_number=sequence_number
+            sender,
+            RestClient.transfer_payload(recipient, amount),
+            sequence_number=sequence_number,
         )
         return await self.submit_bcs_transaction(signed_transaction)  # <:!:bcs_transfer
 
@@ -918,6 +961,12 @@ class FaucetClient:
         if auth_token:
             self.headers["Authorization"] = f"Bearer {auth_token}"
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def close(self):
         await self.rest_client.close()
 
@@ -971,3 +1020,101 @@ class ResourceNotFound(Exception):
         # Call the base class constructor with the parameters it needs
         super().__init__(message)
         self.resource = resource
+
+
+class Test(unittest.IsolatedAsyncioTestCase):
+    def test_transfer_payload(self):
+        recipient = AccountAddress.from_str("0xf")
+        expected = TransactionPayload(
+            EntryFunction.natural(
+                "0x1::aptos_account",
+                "transfer",
+                [],
+                [
+                    TransactionArgument(recipient, Serializer.struct),
+                    TransactionArgument(5000, Serializer.u64),
+                ],
+            )
+        )
+        self.assertEqual(RestClient.transfer_payload(recipient, 5000), expected)
+
+    async def wait_for_transaction(self, responses, transaction_wait_in_seconds=20):
+        """
+        Runs RestClient.wait_for_transaction against a canned sequence of responses to _get and
+        returns the result, the requested endpoints, and the backoff delays.
+        """
+        get_patcher = unittest.mock.patch.object(
+            RestClient, "_get", side_effect=responses
+        )
+        sleep_patcher = unittest.mock.patch("asyncio.sleep")
+        get = get_patcher.start()
+        sleep = sleep_patcher.start()
+        self.addCleanup(get_patcher.stop)
+        self.addCleanup(sleep_patcher.stop)
+
+        client_config = ClientConfig()
+        client_config.transaction_wait_in_seconds = transaction_wait_in_seconds
+        rest_client = RestClient(
+            "https://fullnode.devnet.aptoslabs.com/v1", client_config
+        )
+        self.addAsyncCleanup(rest_client.close)
+        try:
+            result = await rest_client.wait_for_transaction("0x1")
+        finally:
+            endpoints = [call.kwargs["endpoint"] for call in get.call_args_list]
+            delays = [call.args[0] for call in sleep.call_args_list]
+        return result, endpoints, delays
+
+    async def test_wait_for_transaction_long_poll(self):
+        committed = {"type": "user_transaction", "success": True, "hash": "0x1"}
+        result, endpoints, delays = await self.wait_for_transaction(
+            [httpx.Response(200, json=committed)]
+        )
+        self.assertEqual(result, committed)
+        self.assertEqual(endpoints, ["transactions/wait_by_hash/0x1"])
+        self.assertEqual(delays, [])
+
+    async def test_wait_for_transaction_falls_back_to_by_hash(self):
+        committed = {"type": "user_transaction", "success": True, "hash": "0x1"}
+        result, endpoints, delays = await self.wait_for_transaction(
+            [httpx.Response(404, text="Not Found"), httpx.Response(200, json=committed)]
+        )
+        self.assertEqual(result, committed)
+        self.assertEqual(
+            endpoints, ["transactions/wait_by_hash/0x1", "transactions/by_hash/0x1"]
+        )
+        self.assertEqual(delays, [])
+
+    async def test_wait_for_transaction_backs_off(self):
+        not_found = {"error_code": "transaction_not_found"}
+        pending = {"type": "pending_transaction", "hash": "0x1"}
+        committed = {"type": "user_transaction", "success": True, "hash": "0x1"}
+        result, endpoints, delays = await self.wait_for_transaction(
+            [
+                httpx.Response(404, json=not_found),
+                httpx.Response(200, json=pending),
+                httpx.Response(200, json=pending),
+                httpx.Response(200, json=pending),
+                httpx.Response(200, json=committed),
+            ]
+        )
+        self.assertEqual(result, committed)
+        self.assertEqual(endpoints, ["transactions/wait_by_hash/0x1"] * 5)
+        self.assertEqual(delays, [0.25, 0.5, 1.0, 1.0])
+
+    async def test_wait_for_transaction_failed(self):
+        failed = {"type": "user_transaction", "success": False, "hash": "0x1"}
+        with self.assertRaises(AssertionError):
+            await self.wait_for_transaction([httpx.Response(200, json=failed)])
+
+    async def test_wait_for_transaction_api_error(self):
+        with self.assertRaises(ApiError) as context:
+            await self.wait_for_transaction([httpx.Response(503, text="unavailable")])
+        self.assertEqual(context.exception.status_code, 503)
+
+    async def test_wait_for_transaction_timeout(self):
+        pending = {"type": "pending_transaction", "hash": "0x1"}
+        with self.assertRaisesRegex(AssertionError, "timed out"):
+            await self.wait_for_transaction(
+                [httpx.Response(200, json=pending)], transaction_wait_in_seconds=0
+            )
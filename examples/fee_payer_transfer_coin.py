@@ -40,9 +40,12 @@ async def main():
 
     print("\n=== Initial Data ===")
     # :!:>section_4
-    alice_sequence_number = await rest_client.account_sequence_number(alice.address())
-    bob_balance = await rest_client.account_balance(bob.address())
-    sponsor_balance = await rest_client.account_balance(sponsor.address())
+    alice_sequence_number = rest_client.account_sequence_number(alice.address())
+    bob_balance = rest_client.account_balance(bob.address())
+    sponsor_balance = rest_client.account_balance(sponsor.address())
+    [alice_sequence_number, bob_balance, sponsor_balance] = await asyncio.gather(
+        *[alice_sequence_number, bob_balance, sponsor_balance]
+    )
     print(f"Alice sequence number: {alice_sequence_number}")
     print(f"Bob balance: {bob_balance}")
     print(f"Sponsor balance: {sponsor_balance}")  # <:!:section_4
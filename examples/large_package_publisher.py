@@ -23,11 +23,13 @@ from .common import API_KEY, APTOS_CORE_PATH, FAUCET_AUTH_TOKEN, FAUCET_URL, NOD
 
 
 async def publish_large_packages(large_packages_dir) -> AccountAddress:
-    rest_client = RestClient(NODE_URL, client_config=ClientConfig(api_key=API_KEY))
-    faucet_client = FaucetClient(FAUCET_URL, rest_client, FAUCET_AUTH_TOKEN)
+    async with RestClient(
+        NODE_URL, client_config=ClientConfig(api_key=API_KEY)
+    ) as rest_client:
+        faucet_client = FaucetClient(FAUCET_URL, rest_client, FAUCET_AUTH_TOKEN)
 
-    alice = Account.generate()
-    await faucet_client.fund_account(alice.address(), 1_000_000_000)
+        alice = Account.generate()
+        await faucet_client.fund_account(alice.address(), 1_000_000_000)
     await aptos_sdk_cli.publish_package(
         large_packages_dir, {"large_packages": alice.address()}, alice, NODE_URL
     )
@@ -15,14 +15,8 @@ from aptos_sdk.account_address import AccountAddress
 from aptos_sdk.account_sequence_number import AccountSequenceNumber
 from aptos_sdk.aptos_token_client import AptosTokenClient, Property, PropertyMap
 from aptos_sdk.async_client import ClientConfig, FaucetClient, RestClient
-from aptos_sdk.bcs import Serializer
 from aptos_sdk.transaction_worker import TransactionWorker
-from aptos_sdk.transactions import (
-    EntryFunction,
-    SignedTransaction,
-    TransactionArgument,
-    TransactionPayload,
-)
+from aptos_sdk.transactions import SignedTransaction
 
 from .common import API_KEY, FAUCET_AUTH_TOKEN, FAUCET_URL, NODE_URL
 
@@ -205,20 +199,8 @@ async def transfer_transaction(
     recipient: AccountAddress,
     amount: int,
 ) -> SignedTransaction:
-    transaction_arguments = [
-        TransactionArgument(recipient, Serializer.struct),
-        TransactionArgument(amount, Serializer.u64),
-    ]
-    payload = EntryFunction.natural(
-        "0x1::aptos_account",
-        "transfer",
-        [],
-        transaction_arguments,
-    )
-
-    return await client.create_bcs_signed_transaction(
-        sender, TransactionPayload(payload), sequence_number
-    )
+    payload = RestClient.transfer_payload(recipient, amount)
+    return await client.create_bcs_signed_transaction(sender, payload, sequence_number)
 
 
 # This will create a collection in the first transaction and then create NFTs thereafter.
@@ -346,8 +328,9 @@ async def distribute(
         txns.append(rest_client.submit_bcs_transaction(txn))
 
     txn_hashes.extend(await asyncio.gather(*txns))
-    for txn_hash in txn_hashes:
-        await rest_client.wait_for_transaction(txn_hash)
+    await asyncio.gather(
+        *[rest_client.wait_for_transaction(txn_hash) for txn_hash in txn_hashes]
+    )
     await account_sequence_number.synchronize()
 
 